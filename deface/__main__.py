@@ -13,4 +13,8 @@
 # limitations under the License.
 
 from deface.cli import main
-main()
+
+# The guard keeps worker processes, which may import this module, from running
+# the command line tool yet again.
+if __name__ == '__main__':
+  main()
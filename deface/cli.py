@@ -17,17 +17,24 @@ The command line interface to *deface*.
 """
 
 from argparse import ArgumentParser, BooleanOptionalAction
+import functools
+import io
+import itertools
+import mmap
+import os
 import sys
-from typing import Any
+from typing import Any, Callable, Iterator
 
 from deface import __version__
-from deface.serde import dumps, loads
+from deface.serde import dumper, dumps, iter_items
 from deface.ingest import find_simultaneous_posts, PostHistory
 from deface.logger import Logger, pluralize
-from deface.validator import Validator
+from deface.model import Post
 
 __all__ = ['create_parser', 'main']
 
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
 def create_parser() -> ArgumentParser:
   """Create the argument parser for the deface command line tool."""
   prog = 'deface'
@@ -63,6 +70,11 @@ def create_parser() -> ArgumentParser:
     action=BooleanOptionalAction, default=True,
     help='enable or disable the use of color in the output'
   )
+  this_run.add_argument(
+    '-q', '--quiet',
+    action='store_true',
+    help='do not print informational messages'
+  )
   this_run.add_argument(
     '-f', '--format',
     choices=['json', 'ndjson', 'pretty', 'none'], default='ndjson',
@@ -74,6 +86,60 @@ def create_parser() -> ArgumentParser:
   parser.add_argument('filenames', metavar='FILE', nargs='+', help=file_help)
   return parser
 
+# ------------------------------------------------------------------------------
+
+def _read_items(filename: str, failures: list[Exception]) -> Iterator[Any]:
+  """
+  Read the file with the given name and yield the posts as they are parsed.
+  Instead of raising an exception, this generator appends it to ``failures``
+  and stops, so that the posts parsed until then still count as processed.
+  """
+  try:
+    with open(filename, 'rb') as file:
+      # Map the file into memory instead of reading it into a bytes object.
+      # Since mmap() rejects empty files, those are read as usual.
+      if os.fstat(file.fileno()).st_size == 0:
+        yield from iter_items(file.read(), field='status_updates')
+        return
+      with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        # Have the kernel read ahead, so that disk IO overlaps with parsing.
+        # Since restore_utf8() scans the file once from front to back, the
+        # kernel may also drop pages soon after they have been read.
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+          data.madvise(mmap.MADV_SEQUENTIAL)
+        if hasattr(mmap, 'MADV_WILLNEED'):
+          data.madvise(mmap.MADV_WILLNEED)
+        yield from iter_items(data, field='status_updates')
+  except Exception as read_err:
+    failures.append(read_err)
+
+# ------------------------------------------------------------------------------
+
+def _emit_ndjson(out: io.BufferedWriter, timeline: list[Post]) -> None:
+  write = out.write
+  for post in timeline:
+    write((dumps(post) + '\n').encode('utf8'))
+
+def _emit_array(
+  out: io.BufferedWriter, timeline: list[Post], encode: Callable[[Any], str]
+) -> None:
+  write = out.write
+  write(b'[\n')
+  if timeline:
+    # Only the last post goes without trailing comma.
+    for post in itertools.islice(timeline, len(timeline) - 1):
+      write((encode(post) + ',\n').encode('utf8'))
+    write((encode(timeline[-1]) + '\n').encode('utf8'))
+  write(b']\n')
+
+_pretty_dumps = dumper(indent=2)
+
+_EMITTERS: dict[str, Callable[[io.BufferedWriter, list[Post]], None]] = {
+  'json': functools.partial(_emit_array, encode=dumps),
+  'ndjson': _emit_ndjson,
+  'pretty': functools.partial(_emit_array, encode=_pretty_dumps),
+}
+
 def main() -> None:
   """
   A command line tool to convert Facebook posts from their personal archive
@@ -84,37 +150,33 @@ def main() -> None:
   """
   parser = create_parser()
   args = parser.parse_args()
-  if sys.version_info < (3, 9,):
-    parser.exit(status=2, message='deface requires Python 3.9 or later')
+  if sys.version_info < (3, 10,):
+    parser.exit(status=2, message='deface requires Python 3.10 or later')
 
   # Make errors and warnings appear in line-terminated comments. While they are
   # printed to standard error instead of standard output, that nonetheless helps
   # to visually offset them from the JSON output. Besides, some users may just
   # want to include errors or warnings in the output as well.
-  logger = Logger(prefix = '// ', use_color=args.color)
+  logger = Logger(prefix = '// ', use_color=args.color, is_quiet=args.quiet)
 
   # Iterate over files and collect posts.
   processed = 0
   malformed = 0
 
+  # All posts are added to the same history in command line order. Since merging
+  # is order dependent, combining per-file histories could change the result.
   history = PostHistory()
   for filename in args.filenames:
-    logger.info(f'Processing file "{filename}"')
-    try:
-      with open(filename, 'rb') as file:
-        json_data = loads(file.read())
-    except Exception as read_err:
-      logger.error(read_err)
-      continue
-    if isinstance(json_data, dict) and 'status_updates' in json_data:
-      json_data = json_data['status_updates']
-    if isinstance(json_data, list):
-      processed += len(json_data)
-
-    wrapped_data = Validator[Any](json_data, filename=filename)
-    errors = history.ingest(wrapped_data)
+    logger.info('Processing file "{filename}"', filename=filename)
+    # Posts are parsed and ingested one at a time, without collecting them in a
+    # list first.
+    failures: list[Exception] = []
+    count, errors = history.ingest_items(
+      _read_items(filename, failures), filename=filename
+    )
+    processed += count
     malformed += len(errors)
-    for err in errors:
+    for err in itertools.chain(errors, failures):
       logger.error(err)
 
   # Extract timeline.
@@ -123,36 +185,27 @@ def main() -> None:
 
   # Warn about multiple posts with the same timestamp. They do happen. But they
   # do happen so rarely that they deserve manual validation.
-  simultaneous_times = 0
-  simultaneous_posts = 0
-  for timeline_range in find_simultaneous_posts(timeline):
-    count = timeline_range.stop - timeline_range.start
-    simultaneous_times += 1
-    simultaneous_posts += count
-    posts = [timeline[index] for index in timeline_range]
+  simultaneous_ranges = find_simultaneous_posts(timeline)
+  simultaneous_times = len(simultaneous_ranges)
+  simultaneous_posts = sum(len(r) for r in simultaneous_ranges)
+  for timeline_range in simultaneous_ranges:
+    count = len(timeline_range)
+    posts = timeline[timeline_range.start:timeline_range.stop]
     logger.warn(
       f'There are {count} posts with timestamp {posts[0].timestamp}',
       *posts
     )
 
-  # Emit the timeline of posts.
-  if args.format in ['json', 'pretty']:
-    sys.stdout.write('[\n')
-
+  # Emit the timeline of posts, unless the user opted out of output. Output
+  # goes through a large buffer, so that serializing many posts results in few
+  # writes to standard output.
   if args.format != 'none':
-    for index, post in enumerate(timeline):
-      if args.format != 'pretty':
-        sys.stdout.write(dumps(post))
-      else:
-        sys.stdout.write(dumps(post, indent=2))
-      if args.format != 'ndjson' and index < ingested - 1:
-        sys.stdout.write(',\n')
-      else:
-        sys.stdout.write('\n')
-
-  if args.format in ['json', 'pretty']:
-    sys.stdout.write(']\n')
-  sys.stdout.flush()
+    sys.stdout.flush()
+    out = io.BufferedWriter(sys.stdout.buffer, buffer_size=_OUTPUT_BUFFER_SIZE)
+    _EMITTERS[args.format](out, timeline)
+    out.flush()
+    # Detach the buffer, so that it does not close standard output.
+    out.detach()
 
   # Sign off.
   filecount = len(args.filenames)
@@ -18,8 +18,8 @@ validating that posts have the expected structure and types and to then convert
 them to *deface*'s own :py:mod:`deface.model`.
 """
 
-import dataclasses
-from typing import Any, Optional, Union
+import sys
+from typing import Any, Callable, Iterable, Optional, Sequence, Union
 
 from deface.error import DefaceError, MergeError, ValidationError
 from deface.model import (
@@ -46,78 +46,93 @@ __all__ = [
   'find_simultaneous_posts',
 ]
 
-_COMMENT_KEYS: set[str] = { 'author', 'comment', 'timestamp' }
+_COMMENT_KEYS: frozenset[str] = frozenset({ 'author', 'comment', 'timestamp' })
 
 def ingest_comment(data: Validator[Any]) -> Comment:
   """
   Ingest the JSON data value wrapped by the validator as a comment.
   """
   comment_data = data.to_object(valid_keys=_COMMENT_KEYS)
-  comment_data['author'].to_string()
-  comment_data['comment'].to_string()
-  comment_data['timestamp'].to_integer()
-  return Comment(**comment_data.value)
+  return Comment(
+    # The same few authors comment over and over again, so share their names.
+    author=sys.intern(comment_data.require_string('author')),
+    comment=comment_data.require_string('comment'),
+    timestamp=comment_data.require_integer('timestamp'),
+  )
 
 # ------------------------------------------------------------------------------
 
-_EVENT_KEYS = { 'name', 'start_timestamp', 'end_timestamp' }
+_EVENT_KEYS: frozenset[str] = frozenset({
+  'name', 'start_timestamp', 'end_timestamp'
+})
 
 def ingest_event(data: Validator[Any]) -> Event:
   """
   Ingest the JSON data value wrapped by the validator as an event.
   """
   event_data = data.to_object(valid_keys=_EVENT_KEYS)
-  event_data['name'].to_string()
-  event_data['start_timestamp'].to_integer()
-  event_data['end_timestamp'].to_integer()
-  return Event(**event_data.value)
+  return Event(
+    name=event_data.require_string('name'),
+    start_timestamp=event_data.require_integer('start_timestamp'),
+    end_timestamp=event_data.require_integer('end_timestamp'),
+  )
 
 # ------------------------------------------------------------------------------
 
-_EXTERNAL_CONTEXT_KEYS = { 'name', 'source', 'url' }
+_EXTERNAL_CONTEXT_KEYS: frozenset[str] = frozenset({ 'name', 'source', 'url' })
 
 def ingest_external_context(data: Validator[Any]) -> ExternalContext:
   """
   Ingest the JSON data value wrapped by the validator as an external context.
   """
   context_data = data.to_object(valid_keys=_EXTERNAL_CONTEXT_KEYS)
-  if 'name' in context_data.value:
-    context_data['name'].to_string()
-  if 'source' in context_data.value:
-    context_data['source'].to_string()
-  context_data['url'].to_string()
-  return ExternalContext(**context_data.value)
+  name = context_data.get_string('name')
+  source = context_data.get_string('source')
+  if source is not None:
+    source = sys.intern(source)
+  return ExternalContext(
+    url=context_data.require_string('url'),
+    name=name,
+    source=source,
+  )
 
 # ------------------------------------------------------------------------------
 
-_LOCATION_KEYS: set[str] = { 'address', 'coordinate', 'name', 'url' }
-_COORDINATE_KEYS: set[str] = { 'latitude', 'longitude' }
+_LOCATION_KEYS: frozenset[str] = frozenset({
+  'address', 'coordinate', 'name', 'url'
+})
+_COORDINATE_KEYS: frozenset[str] = frozenset({ 'latitude', 'longitude' })
 
 def ingest_location(data: Validator[Any]) -> Location:
   """
   Ingest the JSON data value wrapped by the validator as a location.
   """
   location_data = data.to_object(valid_keys=_LOCATION_KEYS)
-  fields: dict[str, Any] = {}
-  if 'address' in location_data.value:
-    fields['address'] = location_data['address'].to_string().value
+  address = location_data.get_string('address')
 
+  latitude: Optional[float] = None
+  longitude: Optional[float] = None
   if 'coordinate' in location_data.value:
     coordinate = location_data['coordinate'].to_object(
       valid_keys=_COORDINATE_KEYS
     )
-    fields['latitude'] = float(coordinate['latitude'].to_float().value)
-    fields['longitude'] = float(coordinate['longitude'].to_float().value)
-
-  fields['name'] = location_data['name'].to_string().value
-  if 'url' in location_data.value:
-    fields['url'] = location_data['url'].to_string().value
-
-  return Location(**fields)
+    latitude = float(coordinate.require_float('latitude'))
+    longitude = float(coordinate.require_float('longitude'))
+
+  name = sys.intern(location_data.require_string('name'))
+  url = location_data.get_string('url')
+
+  return Location(
+    name=name,
+    address=address,
+    latitude=latitude,
+    longitude=longitude,
+    url=url,
+  )
 
 # ------------------------------------------------------------------------------
 
-_MEDIA_METADATA_KEYS: set[str] = {
+_MEDIA_METADATA_KEYS: frozenset[str] = frozenset({
   'camera_make',
   'camera_model',
   'exposure',
@@ -134,6 +149,23 @@ _MEDIA_METADATA_KEYS: set[str] = {
   'taken_timestamp',
   'upload_ip',
   'upload_timestamp',
+})
+
+# The metadata fields that map one-to-one onto attributes of MediaMetaData,
+# together with the getter for their type.
+_METADATA_FIELD_GETTERS: dict[str, Callable[[Validator[Any], str], Any]] = {
+  'camera_make': Validator.require_string,
+  'camera_model': Validator.require_string,
+  'exposure': Validator.require_string,
+  'focal_length': Validator.require_string,
+  'f_stop': Validator.require_string,
+  'latitude': Validator.require_float,
+  'longitude': Validator.require_float,
+  'modified_timestamp': Validator.require_integer,
+  'orientation': Validator.require_integer,
+  'original_height': Validator.require_integer,
+  'original_width': Validator.require_integer,
+  'taken_timestamp': Validator.require_integer,
 }
 
 def ingest_metadata(
@@ -147,48 +179,30 @@ def ingest_metadata(
   """
   metadata = data.to_object(valid_keys=_MEDIA_METADATA_KEYS)
 
-  if 'upload_ip' in metadata.value:
-    media_fields['upload_ip'] = metadata['upload_ip'].to_string().value
-  if 'upload_timestamp' in metadata.value:
-    media_fields['upload_timestamp'] = (
-      metadata['upload_timestamp'].to_integer().value
-    )
+  media_fields['upload_ip'] = metadata.get_string('upload_ip')
+  media_fields['upload_timestamp'] = metadata.get_integer('upload_timestamp')
+
+  iso_speed = metadata.get_integer('iso')
+  if iso_speed is None:
+    iso_speed = metadata.get_integer('iso_speed')
 
+  # Most metadata objects have only a few fields. So only visit those that are
+  # present, in the order they appear in. A field's value is never None.
   fields: dict[str, Any] = {}
-  if 'camera_make' in metadata.value:
-    fields['camera_make'] = metadata['camera_make'].to_string().value
-  if 'camera_model' in metadata.value:
-    fields['camera_model'] = metadata['camera_model'].to_string().value
-  if 'exposure' in metadata.value:
-    fields['exposure'] = metadata['exposure'].to_string().value
-  if 'focal_length' in metadata.value:
-    fields['focal_length'] = metadata['focal_length'].to_string().value
-  if 'f_stop' in metadata.value:
-    fields['f_stop'] = metadata['f_stop'].to_string().value
-  if 'iso' in metadata.value:
-    fields['iso_speed'] = metadata['iso'].to_integer().value
-  elif 'iso_speed' in metadata.value:
-    fields['iso_speed'] = metadata['iso_speed'].to_integer().value
-  if 'latitude' in metadata.value:
-    fields['latitude'] = metadata['latitude'].to_float().value
-  if 'longitude' in metadata.value:
-    fields['longitude'] = metadata['longitude'].to_float().value
-  if 'modified_timestamp' in metadata.value:
-    fields['modified_timestamp'] = metadata['modified_timestamp'].to_integer().value
-  if 'orientation' in metadata.value:
-    fields['orientation'] = metadata['orientation'].to_integer().value
-  if 'original_height' in metadata.value:
-    fields['original_height'] = metadata['original_height'].to_integer().value
-  if 'original_width' in metadata.value:
-    fields['original_width'] = metadata['original_width'].to_integer().value
-  if 'taken_timestamp' in metadata.value:
-    fields['taken_timestamp'] = metadata['taken_timestamp'].to_integer().value
-
-  return MediaMetaData(**fields) if len(fields) > 0 else None
+  for key in metadata.value:
+    get = _METADATA_FIELD_GETTERS.get(key)
+    if get is not None:
+      fields[key] = get(metadata, key)
+  if iso_speed is not None:
+    fields['iso_speed'] = iso_speed
+
+  if not fields:
+    return None
+  return MediaMetaData(**fields)
 
 # ------------------------------------------------------------------------------
 
-_MEDIA_KEYS: set[str] = {
+_MEDIA_KEYS: frozenset[str] = frozenset({
   'comments',
   'creation_timestamp',
   'description',
@@ -196,69 +210,90 @@ _MEDIA_KEYS: set[str] = {
   'thumbnail',
   'title',
   'uri',
+})
+
+_METADATA_KEYS: frozenset[str] = frozenset({
+  'photo_metadata', 'video_metadata'
+})
+_THUMBNAIL_KEYS: frozenset[str] = frozenset({ 'uri' })
+
+_METADATA_KEY_TO_MEDIA_TYPE: dict[str, MediaType] = {
+  'photo_metadata': MediaType.PHOTO,
+  'video_metadata': MediaType.VIDEO,
 }
 
-_METADATA_KEYS: set[str] = { 'photo_metadata', 'video_metadata' }
+# Without metadata, the file extension determines the media type. Only videos
+# need an entry since everything else is a photo.
+_EXTENSION_TO_MEDIA_TYPE: dict[str, MediaType] = {
+  'mp4': MediaType.VIDEO,
+}
 
 def ingest_media(data: Validator[Any]) -> Media:
   """
   Ingest the JSON data value wrapped by the validator as a media descriptor.
   """
   media_data = data.to_object(valid_keys=_MEDIA_KEYS)
+  media_value = media_data.value
   fields: dict[str, Any] = {}
 
-  comments: list[Comment] = []
-  if 'comments' in media_data.value:
-    for comment_data in media_data['comments'].to_list().items():
-      comments.append(ingest_comment(comment_data))
-  fields['comments'] = tuple(comments)
+  if 'comments' in media_value:
+    fields['comments'] = tuple(
+      ingest_comment(comment_data)
+      for comment_data in media_data['comments'].to_list().items()
+    )
 
   fields['creation_timestamp'] = (
-    media_data['creation_timestamp'].to_integer().value
+    media_data.require_integer('creation_timestamp')
   )
 
-  if 'description' in media_data.value:
-    fields['description'] = media_data['description'].to_string().value
+  fields['description'] = media_data.get_string('description')
 
-  uri = fields['uri'] = media_data['uri'].to_string().value
-
-  if 'media_metadata' in media_data.value:
+  if 'media_metadata' in media_value:
     metadata = media_data['media_metadata'].to_object(
       valid_keys=_METADATA_KEYS, singleton=True
     )
     metadata_key = metadata.only_key
-    fields['media_type'] = (
-      MediaType.VIDEO if metadata_key == 'video_metadata' else MediaType.PHOTO
-    )
+    fields['media_type'] = _METADATA_KEY_TO_MEDIA_TYPE[metadata_key]
     metadata = metadata[metadata_key].to_object()
-    if len(metadata.value) == 1 and 'exif_data' in metadata.value:
+    metadata_value = metadata.value
+    if len(metadata_value) == 1 and 'exif_data' in metadata_value:
       metadata = metadata['exif_data'].to_list(Sized.EXACTLY_ONE)[0].to_object()
     media_metadata = ingest_metadata(metadata, fields)
     if media_metadata is not None:
       fields['metadata'] = media_metadata
-  else:
-    fields['media_type'] = (
-      MediaType.VIDEO if uri.endswith('.mp4') else MediaType.PHOTO
-    )
 
-  if 'thumbnail' in media_data.value:
+  if 'thumbnail' in media_value:
     thumbnail_data = media_data['thumbnail'].to_object(
-      valid_keys={'uri'}, singleton=True
+      valid_keys=_THUMBNAIL_KEYS, singleton=True
     )
-    fields['thumbnail'] = thumbnail_data['uri'].to_string().value
+    fields['thumbnail'] = thumbnail_data.require_string('uri')
 
-  if 'title' in media_data.value:
-    fields['title'] = media_data['title'].to_string().value
+  title = media_data.get_string('title')
+  if title is not None:
+    fields['title'] = sys.intern(title)
+
+  uri = fields['uri'] = media_data.require_string('uri')
+  if 'media_type' not in fields:
+    _, dot, extension = uri.rpartition('.')
+    fields['media_type'] = (
+      _EXTENSION_TO_MEDIA_TYPE.get(extension, MediaType.PHOTO)
+      if dot else MediaType.PHOTO
+    )
 
   return Media(**fields)
 
 # ------------------------------------------------------------------------------
 
-_ATTACHMENT_KEYS: set[str] = {
+_ATTACHMENT_KEYS: frozenset[str] = frozenset({
   'event', 'external_context', 'media', 'name', 'place', 'text'
-}
-_DATA_KEYS: set[str] = { 'backdated_timestamp', 'post', 'update_timestamp' }
-_POST_KEYS: set[str] = { 'attachments', 'data', 'tags', 'timestamp', 'title' }
+})
+_OUTER_ATTACHMENT_KEYS: frozenset[str] = frozenset({ 'data' })
+_DATA_KEYS: frozenset[str] = frozenset({
+  'backdated_timestamp', 'post', 'update_timestamp'
+})
+_POST_KEYS: frozenset[str] = frozenset({
+  'attachments', 'data', 'tags', 'timestamp', 'title'
+})
 
 def _handle_attachments(
   data: Validator[Any], fields: dict[str, Any]
@@ -266,51 +301,69 @@ def _handle_attachments(
   """
   Handle a post's attachments, collecting individual fields in the eponymous
   dictionary and possibly repeated ``media``, ``place``, and ``tag`` values
-  in separate lists (to be returned in a tuple).
+  in separate lists (to be returned in a tuple). If the dictionary already
+  contains the post body, this function also removes media descriptions that
+  are the same.
   """
+  post = fields.get('post')
   all_media: list[Media] = []
   all_places: list[Location] = []
   all_text: list[str] = []
+  # The indexes into all_places, grouped by merge key. A single pass suffices
+  # for merging places: Places with the same key merge iff their URLs are the
+  # same or one of them is None. Since a merged place keeps the URL, the
+  # recorded places for a key are either one place without URL or places with
+  # pairwise distinct URLs, none of which merge with each other. The relation is
+  # not transitive, so grouping places with union-find would be incorrect.
+  place_indexes: dict[tuple[Any, ...], list[int]] = {}
 
   for outer_item in data.to_list(Sized.ZERO_OR_MORE).items():
-    outer_data = outer_item.to_object(valid_keys={'data'}, singleton=True)
+    outer_data = outer_item.to_object(
+      valid_keys=_OUTER_ATTACHMENT_KEYS, singleton=True
+    )
     for inner_item in outer_data['data'].to_list().items():
       inner_data = inner_item.to_object(
         valid_keys=_ATTACHMENT_KEYS, singleton=True
       )
       key = inner_data.only_key
-      if key == 'media':
-        all_media.append(ingest_media(inner_data[key]))
-      elif key == 'place':
-        a_place = ingest_location(inner_data[key])
-        did_merge = False
-        for index, another_place in enumerate(all_places):
-          try:
-            all_places[index] = a_place.merge(another_place)
-            did_merge = True
-            break
-          except MergeError:
-            pass
-        if not did_merge:
-          all_places.append(a_place)
-      elif key == 'text':
-        all_text.append(inner_data['text'].to_string().value)
-      else:
-        # Remaining fields may be repeated iff values are the same.
-        attachment: Union[ExternalContext, Event, str]
-        if key == 'event':
-          attachment = ingest_event(inner_data[key])
-        elif key == 'external_context':
-          attachment = ingest_external_context(inner_data[key])
-        elif key == 'name':
-          attachment = inner_data[key].to_string().value
-        else:
-          assert False, f'Internal error due to unexpected key "{key}"'
-
-        if not key in fields:
-          fields[key] = attachment
-        elif attachment != fields[key]:
-          inner_data.raise_invalid(f'has repeated, divergent value for field "{key}"')
+      match key:
+        case 'media':
+          media = ingest_media(inner_data[key])
+          if post is not None and media.description == post:
+            media = media.without_description()
+          all_media.append(media)
+        case 'place':
+          a_place = ingest_location(inner_data[key])
+          indexes = place_indexes.setdefault(a_place.merge_key(), [])
+          for index in indexes:
+            another_place = all_places[index]
+            if a_place.is_mergeable_with(another_place):
+              all_places[index] = a_place.merge(another_place)
+              break
+          else:
+            indexes.append(len(all_places))
+            all_places.append(a_place)
+        case 'text':
+          all_text.append(inner_data.require_string('text'))
+        case _:
+          # Remaining fields may be repeated iff values are the same.
+          attachment: Union[ExternalContext, Event, str]
+          match key:
+            case 'event':
+              attachment = ingest_event(inner_data[key])
+            case 'external_context':
+              attachment = ingest_external_context(inner_data[key])
+            case 'name':
+              attachment = inner_data.require_string(key)
+            case _:
+              assert False, f'Internal error due to unexpected key "{key}"'
+
+          if not key in fields:
+            fields[key] = attachment
+          elif attachment != fields[key]:
+            inner_data.raise_invalid(
+              f'has repeated, divergent value for field "{key}"'
+            )
 
   return all_media, all_places, all_text
 
@@ -319,58 +372,59 @@ def ingest_post(data: Validator[Any]) -> Post:
   Ingest the JSON data value wrapped by the validator as a post.
   """
   post_data = data.to_object(valid_keys=_POST_KEYS)
+  post_value = post_data.value
   fields: dict[str, Any] = {}
 
-  all_media: list[Media]
-  all_places: list[Location]
-  all_text: list[str]
-  if 'attachments' in post_data.value:
-    all_media, all_places, all_text = _handle_attachments(
-      post_data['attachments'], fields
-    )
-  else:
-    all_media = list()
-    all_places = list()
-    all_text = list()
-
-  if 'data' in post_data.value:
+  # Ingest the post body first, so that _handle_attachments() can remove the
+  # same media descriptions as it goes.
+  if 'data' in post_value:
     for item in post_data['data'].to_list(Sized.ZERO_OR_MORE).items():
       item_data = item.to_object(valid_keys=_DATA_KEYS, singleton=True)
       key = item_data.only_key
       if key in fields:
         item_data.raise_invalid(f'has redundant field "{key}"')
       elif key == 'post':
-        fields['post'] = item_data['post'].to_string().value
+        fields['post'] = item_data.require_string('post')
       else:
-        fields[key] = item_data[key].to_integer().value
-
-  tags: list[str] = []
-  if 'tags' in post_data.value:
-    for tag_data in post_data['tags'].to_list().items():
-      tags.append(tag_data.to_string().value)
-  fields['tags'] = tuple(tags)
-
-  fields['timestamp'] = post_data['timestamp'].to_integer().value
-  if 'title' in post_data.value:
-    fields['title'] = post_data['title'].to_string().value
-
-  # Adjust media descriptions:
-  #  1. Remove description from media object, if post body is the same.
-  #  2. Hoist description to post body, if all media objects have same one
-  #     and there is no post body.
-  # In both cases, the post body is given priority over media descriptions.
-  if 'post' in fields:
-    post = fields['post']
-    for index, media in enumerate(all_media):
-      if post == media.description:
-        media = dataclasses.replace(media, description=None)
-        all_media[index] = media
-  elif len(all_media) > 0 and all_media[0].description is not None:
-    post = all_media[0].description
-    if all(post == media.description for media in all_media):
+        fields[key] = item_data.require_integer(key)
+
+  # Posts without attachments need no lists, and tuple() returns empty tuples
+  # as is.
+  all_media: Sequence[Media] = ()
+  all_places: Sequence[Location] = ()
+  all_text: Sequence[str] = ()
+  if 'attachments' in post_value:
+    all_media, all_places, all_text = _handle_attachments(
+      post_data['attachments'], fields
+    )
+
+  if 'tags' in post_value:
+    tags_data = post_data['tags'].to_list()
+    # Test all tags at once and only look for the culprit if that test fails.
+    if all(isinstance(tag, str) for tag in tags_data.value):
+      fields['tags'] = tuple(tags_data.value)
+    else:
+      fields['tags'] = tuple(
+        tag_data.to_string().value for tag_data in tags_data.items()
+      )
+
+  fields['timestamp'] = post_data.require_integer('timestamp')
+  title = post_data.get_string('title')
+  if title is not None:
+    fields['title'] = sys.intern(title)
+
+  # Hoist description to post body, if there is no post body and all media
+  # objects have the same one. If there is a post body, _handle_attachments()
+  # already removed media descriptions that are the same. In both cases, the
+  # post body is given priority over media descriptions.
+  if 'post' not in fields:
+    post = all_media[0].description if all_media else None
+    if (
+      post is not None
+      and all(post == media.description for media in all_media)
+    ):
       fields['post'] = post
-      for index, media in enumerate(all_media):
-        all_media[index] = dataclasses.replace(media, description=None)
+      all_media = [media.without_description() for media in all_media]
   fields['media'] = tuple(all_media)
   fields['places'] = tuple(all_places)
   fields['text'] = tuple(all_text)
@@ -401,16 +455,49 @@ class PostHistory:
     """
     errors: list[DefaceError] = []
     for item_data in data.to_list().items():
-      try:
-        post = ingest_post(item_data)
-        self.add(post)
-      except MergeError as err:
-        errors.append(err)
-      except ValidationError as err:
-        err.args = err.args + (item_data.value,)
-        errors.append(err)
+      error = self.ingest_one(item_data)
+      if error is not None:
+        errors.append(error)
     return errors
 
+  def ingest_items(
+    self, items: Iterable[Any], *, filename: str
+  ) -> tuple[int, list[DefaceError]]:
+    """
+    Ingest the already parsed JSON values as posts into this history. Unlike
+    :py:meth:`ingest`, this method does not wrap a list of posts in a validator
+    but wraps each post on its own, as it is consumed from ``items``. It returns
+    the number of ingested values and a list of errors detected during
+    ingestion.
+    """
+    # Since the posts are not collected in a list, the root validator only
+    # serves as source of the filename when reporting errors.
+    root = Validator[list[Any]]([], filename=filename)
+    ingest_one = self.ingest_one
+    errors: list[DefaceError] = []
+    count = 0
+    for count, item in enumerate(items, 1):
+      error = ingest_one(Validator(item, key=count - 1, parent=root))
+      if error is not None:
+        errors.append(error)
+    return count, errors
+
+  def ingest_one(self, data: Validator[Any]) -> Optional[DefaceError]:
+    """
+    Ingest the JSON data value wrapped by the validator as a single post into
+    this history and return the error detected during ingestion, if any. Unlike
+    :py:meth:`ingest`, this method does not require that all posts are available
+    as one list and hence supports consuming posts as they are being parsed.
+    """
+    try:
+      self.add(ingest_post(data))
+    except MergeError as err:
+      return err
+    except ValidationError as err:
+      err.args = err.args + (data.value,)
+      return err
+    return None
+
   def add(self, post: Post) -> None:
     """
     Add the post to the history of posts. If the history already includes one or
@@ -419,12 +506,12 @@ class PostHistory:
     Otherwise, this method adds the post to the history.
     """
     timestamp = post.timestamp
-    if timestamp not in self._posts:
+    already_recorded = self._posts.get(timestamp)
+    if already_recorded is None:
       # No prior post with same timestamp.
       self._posts[timestamp] = post
       return
 
-    already_recorded = self._posts[timestamp]
     if isinstance(already_recorded, Post):
       # One prior post with same timestamp.
       if already_recorded.is_mergeable_with(post):
@@ -445,13 +532,14 @@ class PostHistory:
     Get a timeline for the history of posts. The timeline includes all posts
     from the history in chronological order.
     """
+    # Sorting the timestamps suffices, since posts are bucketed by timestamp.
     posts: list[Post] = []
-    for value in self._posts.values():
+    for timestamp in sorted(self._posts):
+      value = self._posts[timestamp]
       if isinstance(value, Post):
         posts.append(value)
       else:
         posts.extend(value)
-    posts.sort(key=lambda p: p.timestamp)
     return posts
 
 
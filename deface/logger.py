@@ -21,7 +21,6 @@ import enum
 import sys
 
 from deface import serde
-from types import MethodType
 from typing import Any, TextIO, Union
 
 __all__ = ['pluralize', 'Level', 'Logger']
@@ -29,9 +28,6 @@ __all__ = ['pluralize', 'Level', 'Logger']
 def pluralize(count: int, noun: str, suffix: str = 's') -> str:
   return noun + suffix if count != 1 else noun
 
-def _sgr(_: str, code: str) -> str:
-  return f'\x1b[{code}m'
-
 class Level(enum.Enum):
   ERROR = '🛑  '
   WARN = '⚠️  '
@@ -43,6 +39,7 @@ class Logger:
   given ``prefix`` followed by appropriate emoji. If the underlying ``stream``
   is a TTY, it also uses ANSI escape codes to style messages. The use of color
   or emoji can be disabled by setting the corresponding argument to false.
+  Informational messages can be suppressed by setting ``is_quiet`` to true.
   """
   def __init__(
     self,
@@ -50,42 +47,55 @@ class Logger:
     prefix: str = '',
     use_color: bool = True,
     use_emoji: bool = True,
+    is_quiet: bool = False,
   ) -> None:
     self._line_count: int = 0
     self._error_count: int = 0
     self._warn_count: int = 0
     self._stream: TextIO = stream
+    # The ANSI escape codes for starting and ending each style are fixed. So
+    # determine them once.
+    self._bold: tuple[str, str] = ('', '')
+    self._green: tuple[str, str] = ('', '')
+    self._red: tuple[str, str] = ('', '')
     if stream.isatty() and use_color:
-      self._sgr = MethodType(_sgr, self) # type: ignore
+      self._bold = ('\x1b[1m', '\x1b[22m')
+      self._green = ('\x1b[32;4;1m', '\x1b[39;22m')
+      self._red = ('\x1b[31;1m', '\x1b[39;22m')
     self._prefix: str = prefix
     self._use_emoji: bool = use_emoji
+    self._is_quiet: bool = is_quiet
 
   def print(self, text: str = '') -> None:
     """Log the given text followed by a newline."""
     if len(text) > 5_000:
       text = text[:5_000] + '...'
-    self._line_count += text.count('\n') + 1
-    text = self._prefix + text.replace('\n', '\n' + self._prefix) + '\n'
-    self._stream.write(text)
+    prefix = self._prefix
+    if '\n' in text:
+      self._line_count += text.count('\n') + 1
+      text = text.replace('\n', '\n' + prefix)
+    else:
+      self._line_count += 1
+    self._stream.write(prefix + text + '\n')
 
   def print_json(self, value: Any, **kwargs: Any) -> None:
     """Log a nicely indented JSON representation of the given value"""
     self.print(serde.dumps(value, indent=2, **kwargs))
 
-  def _sgr(self, _: str) -> str:
-    return ''
-
   def print_bold(self, text: str) -> None:
     """Log the text in bold followed by a newline."""
-    self.print(self._sgr('1') + text + self._sgr('22'))
+    start, end = self._bold
+    self.print(start + text + end)
 
   def print_in_green(self, text: str) -> None:
     """Log the text in green followed by a newline."""
-    self.print(self._sgr('32;4;1') + text + self._sgr('39;22'))
+    start, end = self._green
+    self.print(start + text + end)
 
   def print_in_red(self, text: str) -> None:
     """Log the text in red followed by a newline."""
-    self.print(self._sgr('31;1') + text + self._sgr('39;22'))
+    start, end = self._red
+    self.print(start + text + end)
 
   def _print_entry(
     self, level: Level, err: Union[str, BaseException], *extras: Any
@@ -133,8 +143,17 @@ class Logger:
     self._warn_count += 1
     self._print_entry(Level.WARN, warning, *extras)
 
-  def info(self, message: str, *extras: Any) -> None:
-    """Print an informational message."""
+  def info(self, message: str, *extras: Any, **kwargs: Any) -> None:
+    """
+    Print an informational message. If there are keyword arguments, the message
+    is a format string, which is formatted with those arguments. Since
+    informational messages may be suppressed, formatting them only if they are
+    printed avoids unnecessary work.
+    """
+    if self._is_quiet:
+      return
+    if kwargs:
+      message = message.format(**kwargs)
     self._print_entry(Level.INFO, message, *extras)
 
   def done(self, message: str) -> None:
@@ -44,6 +44,7 @@ from __future__ import annotations
 
 import dataclasses
 import enum
+import itertools
 
 from typing import Any, Optional, TypeVar
 from deface.error import MergeError
@@ -67,16 +68,12 @@ __all__ = [
 
 def _are_equal_or_one_is_none(o1: object, o2: object) -> bool:
   """Determine whether the two object are equal or one is ``None``."""
-  return (
-    o1 == o2 or (o1 is None and o2 is not None) or (o1 is not None and o2 is None)
-  )
+  return o1 is None or o2 is None or o1 == o2
 
 
 def _are_equal_or_one_is_empty(l1: tuple[T, ...], l2: tuple[T, ...]) -> bool:
   """Determine whether the two tuples are equal or one is the empty tuple."""
-  return (
-    l1 == l2 or (len(l1) == 0 and len(l2) > 0) or (len(l1) > 0 and len(l2) == 0)
-  )
+  return not l1 or not l2 or l1 == l2
 
 
 T = TypeVar('T')
@@ -95,7 +92,7 @@ class MediaType(enum.Enum):
   VIDEO = 'VIDEO'
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Comment:
   """A comment on a post, photo, or video."""
   author: str
@@ -117,7 +114,7 @@ class Comment:
     return cls(**data)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Event:
   """
   An event
@@ -141,7 +138,7 @@ class Event:
     return cls(**data)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ExternalContext:
   """
   The external context for a post. In the original Facebook post data, a post's
@@ -195,7 +192,7 @@ class ExternalContext:
     return cls(**data)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Location:
   """
   A location in the real world. In the original Facebook post data, a post's
@@ -249,6 +246,15 @@ class Location:
   url: Optional[str] = None
   """The URL for the location on `<https://www.facebook.com>`_."""
 
+  def merge_key(self) -> tuple[str, Optional[str], Optional[float], Optional[float]]:
+    """
+    Get the key for looking up mergeable locations. The key comprises all
+    attributes that must be identical for two locations to be mergeable
+    according to :py:meth:`is_mergeable_with`, i.e., all attributes but
+    ``url``.
+    """
+    return self.name, self.address, self.latitude, self.longitude
+
   def is_mergeable_with(self, other: Location) -> bool:
     """
     Determine whether this location can be merged with the other location. For
@@ -295,7 +301,7 @@ class Location:
     return cls(**data)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class MediaMetaData:
   """
   The metadata for a photo or video. In the original Facebook post data, this
@@ -347,8 +353,8 @@ class MediaMetaData:
     elif not self.is_mergeable_with(other):
       raise MergeError('Unable to merge media metadata', self, other)
 
-    taken = _if_not_none_or(self.taken_timestamp, other.taken_timestamp)
-    return dataclasses.replace(self, taken_timestamp=taken)
+    # Mergeable metadata differ in taken_timestamp only, with one being None.
+    return self if self.taken_timestamp is not None else other
 
   @classmethod
   def from_dict(cls, data: dict[str, Any]) -> MediaMetaData:
@@ -360,7 +366,7 @@ class MediaMetaData:
     return cls(**data)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Media:
   """A posted photo or video."""
 
@@ -434,9 +440,29 @@ class Media:
   ingestion.
   """
 
-  comments: tuple[Comment, ...] = dataclasses.field(default_factory=tuple)
+  comments: tuple[Comment, ...] = ()
   """Comments specifically on the photo or video."""
 
+  def without_description(self) -> Media:
+    """
+    Get this media object without a description. If this media object has no
+    description, this method returns ``self``. Otherwise, it returns a new media
+    object with the same attribute values except :py:attr:`description`.
+    """
+    if self.description is None:
+      return self
+    return Media(
+      media_type=self.media_type,
+      uri=self.uri,
+      title=self.title,
+      thumbnail=self.thumbnail,
+      metadata=self.metadata,
+      creation_timestamp=self.creation_timestamp,
+      upload_timestamp=self.upload_timestamp,
+      upload_ip=self.upload_ip,
+      comments=self.comments,
+    )
+
   def is_mergeable_with(self, other: Media) -> bool:
     """
     Determine whether this media object can be merged with the other media
@@ -493,12 +519,17 @@ class Media:
     title = _if_not_none_or(self.title, other.title)
     upload_ip = _if_not_none_or(self.upload_ip, other.upload_ip)
 
-    return dataclasses.replace(
-      self,
-      comments=comments,
-      metadata=metadata,
+    return Media(
+      media_type=self.media_type,
+      uri=self.uri,
+      description=self.description,
       title=title,
+      thumbnail=self.thumbnail,
+      metadata=metadata,
+      creation_timestamp=self.creation_timestamp,
+      upload_timestamp=self.upload_timestamp,
       upload_ip=upload_ip,
+      comments=comments,
     )
 
   @classmethod
@@ -508,16 +539,14 @@ class Media:
     assumes that the JSON text was created by serializing the result of
     :py:func:`deface.serde.prepare`, just as :py:func:`deface.serde.dumps` does.
     """
-    data['comments'] = tuple(
-      [Comment.from_dict(c) for c in data.get('comments', [])]
-    )
+    data['comments'] = tuple(map(Comment.from_dict, data.get('comments', ())))
     data['media_type'] = MediaType[data['media_type']]
     if data.get('metadata'):
       data['metadata'] = MediaMetaData.from_dict(data['metadata'])
     return cls(**data)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Post:
   """A post on Facebook."""
 
@@ -556,7 +585,7 @@ class Post:
   * ``Alice was with Bob.``
   """
 
-  text: tuple[str, ...] = dataclasses.field(default_factory=tuple)
+  text: tuple[str, ...] = ()
   """The text introducing a shared memory."""
 
   external_context: Optional[ExternalContext] = None
@@ -565,7 +594,7 @@ class Post:
   event: Optional[Event] = None
   """The event this post is about."""
 
-  places: tuple[Location, ...] = dataclasses.field(default_factory=tuple)
+  places: tuple[Location, ...] = ()
   """
   The places for this post. Almost all posts have at most one
   :py:class:`Location`. Occasionally, a post has two locations that share the
@@ -576,10 +605,10 @@ class Post:
   with two or more distinct locations seem rare but do occur.
   """
 
-  tags: tuple[str, ...] = dataclasses.field(default_factory=tuple)
+  tags: tuple[str, ...] = ()
   """The tags for a post, including friends and pages."""
 
-  media: tuple[Media, ...] = dataclasses.field(default_factory=tuple)
+  media: tuple[Media, ...] = ()
   """
   The photos and videos attached to a post.
   """
@@ -630,37 +659,45 @@ class Post:
     elif not self.is_mergeable_with(other):
       raise MergeError('Unable to merge unrelated posts', self, other)
 
-    by_uri: dict[str, Media] = {}
-    def collect(media: Media) -> None:
-      if media.uri not in by_uri:
-        by_uri[media.uri] = media
-        return
-
-      previous = by_uri[media.uri]
-      if not previous.is_mergeable_with(media):
-        raise MergeError(
-          'Unable to merge posts with different media descriptors'
-          ' for the same photo/video',
-          self,
-          other,
-        )
-      by_uri[media.uri] = previous.merge(media)
-
-    for media in self.media:
-      collect(media)
-    for media in other.media:
-      collect(media)
+    media: tuple[Media, ...]
+    if len(self.media) + len(other.media) < 2:
+      # With at most one media object, there is nothing to deduplicate.
+      media = self.media or other.media
+    else:
+      by_uri: dict[str, Media] = {}
+      for medium in itertools.chain(self.media, other.media):
+        uri = medium.uri
+        previous = by_uri.get(uri)
+        if previous is None:
+          by_uri[uri] = medium
+        elif previous.is_mergeable_with(medium):
+          by_uri[uri] = previous.merge(medium)
+        else:
+          raise MergeError(
+            'Unable to merge posts with different media descriptors'
+            ' for the same photo/video',
+            self,
+            other,
+          )
+      media = tuple(by_uri.values())
 
     backdated = _if_not_none_or(self.backdated_timestamp, other.backdated_timestamp)
     title = _if_not_none_or(self.title, other.title)
     update = _if_not_none_or(self.update_timestamp, other.update_timestamp)
 
-    return dataclasses.replace(
-      self,
-      media=tuple(by_uri.values()),
+    return Post(
+      timestamp=self.timestamp,
       backdated_timestamp=backdated,
-      title=title,
       update_timestamp=update,
+      post=self.post,
+      name=self.name,
+      title=title,
+      text=self.text,
+      external_context=self.external_context,
+      event=self.event,
+      places=self.places,
+      tags=self.tags,
+      media=media,
     )
 
   @classmethod
@@ -670,12 +707,10 @@ class Post:
     JSON text was created by serializing the result of
     :py:func:`deface.serde.prepare`, just as :py:func:`deface.serde.dumps` does.
     """
-    data['media'] = tuple([Media.from_dict(m) for m in data.get('media', [])])
-    data['places'] = tuple(
-      [Location.from_dict(l) for l in data.get('places', [])]
-    )
-    data['tags'] = tuple(data.get('tags', []))
-    data['text'] = tuple(data.get('text', []))
+    data['media'] = tuple(map(Media.from_dict, data.get('media', ())))
+    data['places'] = tuple(map(Location.from_dict, data.get('places', ())))
+    data['tags'] = tuple(data.get('tags', ()))
+    data['text'] = tuple(data.get('text', ()))
     if data.get('event'):
       data['event'] = Event.from_dict(data['event'])
     if data.get('external_context'):
@@ -19,35 +19,54 @@ and with printing out the cleaned up post data again. Its :py:func:`loads` and
 :py:func:`dumps` functions leave most of the heavy lifting to the corresponding
 functions in Python's builtin ``json`` module. They simply pass keyword
 arguments through. The :py:func:`restore_utf8` and :py:func:`prepare` functions
-encapsulate the added functionality.
+encapsulate the added functionality. Finally, :py:func:`iter_items` incrementally
+deserializes the items of a top-level JSON array, so that callers need not hold
+the entire list of posts in memory.
 """
 
 import dataclasses
 import enum
 import json
+import mmap
 import re
 
 from binascii import unhexlify
-from typing import Any, Mapping, Union
+from typing import Any, Callable, Generator, Iterator, Mapping, Optional, Union
 
 __all__ = [
   'restore_utf8',
   'loads',
+  'iter_items',
   'prepare',
-  'dumps'
+  'dumps',
+  'dumper',
 ]
 
 JsonT = Union[None, bool, int, float, str, list[Any], Mapping[str, object]]
+BufferT = Union[bytes, bytearray, memoryview, mmap.mmap]
 
-_ACTUAL_ESCAPE = re.compile(rb'''
-  (?<!\\)                    # No leading backslash,
-  ((\\\\)*)                  # followed by an even number of backslashes,
-  \\u00([0-9a-f][0-9a-f])    # followed by a unicode escape.
+# The pattern starts with a literal backslash, which lets the regex engine skip
+# ahead to the next backslash instead of trying every position in the text. The
+# lookbehind then ensures that the backslash is the first in a sequence.
+_ACTUAL_ESCAPES = re.compile(rb'''
+  \\(?<!\\\\)                        # A backslash not preceded by a backslash,
+  ((?:\\\\)*)                      # followed by an even number of backslashes,
+  u00([0-9a-f][0-9a-f]             # followed by a unicode escape
+  (?:\\u00[0-9a-f][0-9a-f])*)      # and any number of further escapes.
   ''',
   re.VERBOSE | re.IGNORECASE
 )
 
-def restore_utf8(data: bytes) -> bytes:
+def _restore_escapes(match: re.Match[bytes]) -> bytes:
+  # Non-ASCII characters take several bytes and non-Latin text often consists
+  # of many such characters in a row. Converting entire runs of escape
+  # sequences at once saves a callback per byte.
+  backslashes, escapes = match.groups()
+  return backslashes + unhexlify(
+    escapes.replace(b'\\u00', b'').replace(b'\\U00', b'')
+  )
+
+def restore_utf8(data: BufferT) -> bytes:
   """
   Restore the UTF-8 encoding for files exported from Facebook. Such files may
   appear to be valid JSON at first but nonetheless encode all non-ASCII
@@ -62,12 +81,9 @@ def restore_utf8(data: bytes) -> bytes:
   unicode escape sequence but text discussing unicode escape sequences.
 
   This function should be invoked on the bytes of JSON text, before parsing.
+  Since it accepts any bytes-like object, that includes a memory-mapped file.
   """
-  return re.sub(
-    _ACTUAL_ESCAPE,
-    lambda match: match.group(1) + unhexlify(match.group(3)),
-    data
-  )
+  return _ACTUAL_ESCAPES.sub(_restore_escapes, data)
 
 def loads(data: bytes, **kwargs: Any) -> JsonT:
   """
@@ -78,12 +94,134 @@ def loads(data: bytes, **kwargs: Any) -> JsonT:
   """
   return json.loads(restore_utf8(data), **kwargs)
 
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+def _skip_whitespace(text: str, index: int) -> int:
+  match = _WHITESPACE.match(text, index)
+  assert match is not None
+  return match.end()
+
+def _iter_array(text: str, index: int) -> Generator[JsonT, None, int]:
+  """
+  Yield the items of the JSON array starting just after the opening bracket at
+  the given index. Upon completion, return the index just after the closing
+  bracket.
+  """
+  decode = _DECODER.raw_decode
+  index = _skip_whitespace(text, index)
+  if text.startswith(']', index):
+    return index + 1
+
+  while True:
+    item, index = decode(text, index)
+    yield item
+    index = _skip_whitespace(text, index)
+    if text.startswith(',', index):
+      index = _skip_whitespace(text, index + 1)
+    elif text.startswith(']', index):
+      return index + 1
+    else:
+      raise json.JSONDecodeError("Expecting ',' delimiter", text, index)
+
+def _iter_field(text: str, index: int, field: str) -> Generator[JsonT, None, int]:
+  """
+  Yield the items of the array-valued field of the JSON object starting just
+  after the opening brace at the given index. All other fields are parsed but
+  their values are discarded. Upon completion, return the index just after the
+  closing brace.
+  """
+  decode = _DECODER.raw_decode
+  has_field = False
+  index = _skip_whitespace(text, index)
+  if text.startswith('}', index):
+    index += 1
+  else:
+    while True:
+      if not text.startswith('"', index):
+        raise json.JSONDecodeError(
+          'Expecting property name enclosed in double quotes', text, index
+        )
+      key, index = decode(text, index)
+      index = _skip_whitespace(text, index)
+      if not text.startswith(':', index):
+        raise json.JSONDecodeError("Expecting ':' delimiter", text, index)
+      index = _skip_whitespace(text, index + 1)
+
+      if key == field and text.startswith('[', index):
+        has_field = True
+        index = yield from _iter_array(text, index + 1)
+      else:
+        _, index = decode(text, index)
+
+      index = _skip_whitespace(text, index)
+      if text.startswith(',', index):
+        index = _skip_whitespace(text, index + 1)
+      elif text.startswith('}', index):
+        index += 1
+        break
+      else:
+        raise json.JSONDecodeError("Expecting ',' delimiter", text, index)
+
+  if not has_field:
+    raise ValueError(f'JSON text is not an object with array-valued field {field}')
+  return index
+
+def _iter_text(items: Generator[JsonT, None, int], text: str) -> Iterator[JsonT]:
+  """Yield the given items and then check for extra data after the value."""
+  index = yield from items
+  if _skip_whitespace(text, index) != len(text):
+    raise json.JSONDecodeError('Extra data', text, index)
+
+def iter_items(data: BufferT, field: Optional[str] = None) -> Iterator[JsonT]:
+  """
+  Return an iterator over the items of the JSON array in the given JSON text.
+  Like :py:func:`loads`, this function applies :py:func:`restore_utf8` to the
+  given ``data``. Unlike :py:func:`loads`, it deserializes the array's items one
+  at a time, as the iterator is consumed. If ``field`` is given and the JSON
+  text is an object instead, the iterator covers the items of the array that is
+  that field's value. In that case, the object's other fields are parsed only to
+  be skipped. Since ``data`` may be any bytes-like object, this function can
+  read directly from a memory-mapped file.
+
+  :raises ValueError: indicates that the JSON text is neither an array nor an
+    object with the array-valued field.
+  """
+  text = restore_utf8(data).decode('utf-8-sig')
+  index = _skip_whitespace(text, 0)
+  if text.startswith('[', index):
+    return _iter_text(_iter_array(text, index + 1), text)
+  if field is not None and text.startswith('{', index):
+    return _iter_text(_iter_field(text, index + 1, field), text)
+  raise ValueError('JSON text is not an array')
+
 _EMPTY_LIST: list[Any] = []
 _EMPTY_TUPLE: tuple[Any, ...] = ()
 
+# Most values visited by prepare() are strings and numbers, which are returned
+# as is. Checking their exact type first avoids the other tests.
+_SCALARS: frozenset[type] = frozenset({ str, int, float, bool })
+
 def _is_void(value: Any) -> bool:
   return value is None or value == _EMPTY_LIST or value == _EMPTY_TUPLE
 
+# Determining whether a class is a dataclass and what its fields are takes
+# several steps. Since deface serializes instances of only a few classes, the
+# result is cached per class.
+_FIELD_NAMES: dict[type, Optional[tuple[str, ...]]] = {}
+
+def _field_names(cls: type) -> Optional[tuple[str, ...]]:
+  try:
+    return _FIELD_NAMES[cls]
+  except KeyError:
+    pass
+
+  names: Optional[tuple[str, ...]] = None
+  if dataclasses.is_dataclass(cls):
+    names = tuple(field.name for field in dataclasses.fields(cls))
+  _FIELD_NAMES[cls] = names
+  return names
+
 def prepare(data: Any) -> Any:
   """
   Prepare the given value for serialization to JSON. This function recursively
@@ -93,12 +231,16 @@ def prepare(data: Any) -> Any:
   entries that are ``None``, the empty list ``[]``, or the empty tuple ``()``.
   All other values remain unchanged.
   """
-  if dataclasses.is_dataclass(data):
+  cls = type(data)
+  if cls in _SCALARS:
+    return data
+  field_names = _field_names(cls)
+  if field_names is not None:
     result = {}
-    for field in dataclasses.fields(data):
-      value = getattr(data, field.name)
+    for name in field_names:
+      value = getattr(data, name)
       if not _is_void(value):
-        result[field.name] = prepare(value)
+        result[name] = prepare(value)
     return result
   elif isinstance(data, dict):
     return { k: prepare(v) for k, v in data.items() if not _is_void(v) }
@@ -117,3 +259,16 @@ def dumps(data: Any, **kwargs: Any) -> str:
   the keyword arguments through.
   """
   return json.dumps(prepare(data), **kwargs)
+
+def dumper(**kwargs: Any) -> Callable[[Any], str]:
+  """
+  Create a function that serializes values as JSON text. The function behaves
+  just like :py:func:`dumps` invoked with the given keyword arguments. But it
+  reuses the same ``json.JSONEncoder`` for every invocation, whereas ``json``'s
+  own ``dumps`` instantiates a new encoder for every call with keyword
+  arguments. Hence it is preferable when serializing many values alike.
+  """
+  encode = json.JSONEncoder(**kwargs).encode
+  def dumps_with_encoder(data: Any) -> str:
+    return encode(prepare(data))
+  return dumps_with_encoder
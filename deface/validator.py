@@ -19,8 +19,13 @@ traversing and validating parsed JSON data. The code using the wrapper invokes
 :py:meth:`Validator.to_string`, :py:meth:`Validator.to_list`, and
 :py:meth:`Validator.to_object` to ensure that wrapped values have expected
 types, :py:meth:`Validator.items` to access list items, as well as
-:py:meth:`Validator.__getitem__` to access object properties. The wrapper class
-takes care of tracking the current keypath and precisely reporting any errors.
+:py:meth:`Validator.__getitem__` to access object properties. For optional
+object properties with scalar values, :py:meth:`Validator.get_integer`,
+:py:meth:`Validator.get_float`, and :py:meth:`Validator.get_string` combine
+access and validation. For required object properties with scalar values,
+:py:meth:`Validator.require_integer`, :py:meth:`Validator.require_float`, and
+:py:meth:`Validator.require_string` do the same. The wrapper class takes care of
+tracking the current keypath and precisely reporting any errors.
 """
 
 from __future__ import annotations
@@ -28,7 +33,7 @@ from __future__ import annotations
 import enum
 import json
 from typing import (
-  Any, cast, Generic, Iterator, Mapping, NoReturn, Optional, overload, TypeVar, Union
+  AbstractSet, Any, cast, Generic, Iterator, Mapping, NoReturn, Optional, overload, TypeVar, Union
 )
 
 from deface.error import ValidationError
@@ -41,6 +46,8 @@ ObjectType = Mapping[str, object]
 T = TypeVar('T')
 U = TypeVar('U')
 
+_MISSING = object()
+
 
 class Sized(enum.Enum):
   """A constraint on list size."""
@@ -64,6 +71,9 @@ class Validator(Generic[T]):
   necessary for validation, they do enable accurate error reporting, notably
   through the :py:attr:`keypath`.
   """
+  # Ingestion creates a validator for every list item and many object fields.
+  __slots__ = ('_filename', '_key', '_value', '_parent')
+
   @overload
   def __init__(self, value: T, *, filename: str) -> None: ...
   @overload
@@ -196,7 +206,7 @@ class Validator(Generic[T]):
 
   def to_object(
     self,
-    valid_keys: Optional[set[str]] = None,
+    valid_keys: Optional[AbstractSet[str]] = None,
     singleton: bool = False
   ) -> Validator[ObjectType]:
     """
@@ -212,12 +222,102 @@ class Validator(Generic[T]):
     keys = cast(ObjectType, self._value).keys()
     if singleton and len(keys) != 1:
       self.raise_invalid('is not an object with a single field')
-    if valid_keys is not None:
+    # Test all keys at once and only look for the culprit if that test fails.
+    if valid_keys is not None and not keys <= valid_keys:
       for key in keys:
         if key not in valid_keys:
           self.raise_invalid(f'contains unexpected field {key}')
     return cast(Validator[ObjectType], self)
 
+  def get_integer(self: Validator[ObjectType], key: str) -> Optional[int]:
+    """
+    Get the integer value of the current object's optional field with the given
+    key. If the field is missing, this method returns ``None``. Since the field
+    is looked up only once and a child validator is created only for invalid
+    values, this method is faster than testing for the field and then coercing
+    its value.
+
+    :raises ValidationError: indicates that the field's value is not an integer.
+    """
+    value = self._value.get(key, _MISSING)
+    if value is _MISSING:
+      return None
+    if isinstance(value, int):
+      return value
+    return self[key].to_integer().value
+
+  def get_float(self: Validator[ObjectType], key: str) -> Optional[float]:
+    """
+    Get the integral or floating point value of the current object's optional
+    field with the given key. If the field is missing, this method returns
+    ``None``.
+
+    :raises ValidationError: indicates that the field's value is neither an
+      integer nor a floating point number.
+    """
+    value = self._value.get(key, _MISSING)
+    if value is _MISSING:
+      return None
+    if isinstance(value, (int, float)):
+      return value
+    return self[key].to_float().value
+
+  def get_string(self: Validator[ObjectType], key: str) -> Optional[str]:
+    """
+    Get the string value of the current object's optional field with the given
+    key. If the field is missing, this method returns ``None``.
+
+    :raises ValidationError: indicates that the field's value is not a string.
+    """
+    value = self._value.get(key, _MISSING)
+    if value is _MISSING:
+      return None
+    if isinstance(value, str):
+      return value
+    return self[key].to_string().value
+
+  def require_integer(self: Validator[ObjectType], key: str) -> int:
+    """
+    Get the integer value of the current object's required field with the given
+    key. Like :py:meth:`get_integer`, this method creates a child validator only
+    for invalid values.
+
+    :raises ValidationError: indicates that the field is missing or its value is
+      not an integer.
+    """
+    value = self._value.get(key)
+    if isinstance(value, int):
+      return value
+    return self[key].to_integer().value
+
+  def require_float(self: Validator[ObjectType], key: str) -> float:
+    """
+    Get the integral or floating point value of the current object's required
+    field with the given key. Like :py:meth:`get_float`, this method creates a
+    child validator only for invalid values.
+
+    :raises ValidationError: indicates that the field is missing or its value is
+      neither an integer nor a floating point number.
+    """
+    value = self._value.get(key)
+    if isinstance(value, (int, float)):
+      return value
+    return self[key].to_float().value
+
+  def require_string(self: Validator[ObjectType], key: str) -> str:
+    """
+    Get the string value of the current object's required field with the given
+    key. Like :py:meth:`get_string`, this method creates a child validator only
+    for invalid values.
+
+    :raises ValidationError: indicates that the field is missing or its value is
+      not a string.
+    """
+    value = self._value.get(key)
+    if isinstance(value, str):
+      return value
+    return self[key].to_string().value
+
   @overload
   def __getitem__(self: Validator[list[U]], key: int) -> Validator[U]: ...
   @overload
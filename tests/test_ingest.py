@@ -12,15 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 import pytest
 
 from typing import Any
 
 from deface.error import DefaceError
 from deface.model import (
-  ExternalContext, Location, MediaMetaData, MediaType
+  ExternalContext, Location, MediaMetaData, MediaType, Post
 )
 from deface.ingest import ingest_post, PostHistory
+from deface.serde import iter_items
 from deface.validator import Validator
 
 def test_ingest_post():
@@ -606,3 +608,77 @@ def test_ingest_many_posts():
   assert timeline[3].timestamp == 3
   assert timeline[4].timestamp == 4
 
+
+def test_ingest_items():
+  history = PostHistory()
+  count, errors = history.ingest_items(
+    iter([{ 'timestamp': 2 }, { 'timestamp': '1' }, { 'timestamp': 1 }]),
+    filename='stream'
+  )
+  assert count == 3
+  assert len(errors) == 1
+  assert errors[0].args[0] == 'stream[1].timestamp is not an integer'
+  assert [post.timestamp for post in history.timeline()] == [1, 2]
+
+  # Posts are ingested as they are parsed, so those before an error count.
+  history = PostHistory()
+  with pytest.raises(ValueError):
+    history.ingest_items(iter_items(
+      b'{"status_updates": [{"timestamp": 1}, {"timestamp": 2}, oops]}',
+      field='status_updates'
+    ), filename='stream')
+  assert [post.timestamp for post in history.timeline()] == [1, 2]
+
+def _place(url=None):
+  data = { 'name': 'Somewhere', 'address': '1 Nowhere Place' }
+  if url is not None:
+    data['url'] = url
+  return { 'data': [{ 'place': data }]}
+
+def test_ingest_places():
+  post = ingest_post(Validator[Any]({
+    'timestamp': 665,
+    'attachments': [
+      _place('https://apparebit.com'),
+      _place('https://example.com'),
+      _place(),
+      _place('https://example.com'),
+    ],
+  }, filename='places'))
+  assert [p.url for p in post.places] == [
+    'https://apparebit.com', 'https://example.com'
+  ]
+
+def test_post_history_add():
+  history = PostHistory()
+  history.add(Post(timestamp=665, post='Hello'))
+  history.add(Post(timestamp=665, post='Bye'))
+  history.add(Post(timestamp=665, post='Hello', title='Alice'))
+  history.add(Post(timestamp=665, post='Hello', title='Bob'))
+  assert [(p.post, p.title) for p in history.timeline()] == [
+    ('Hello', 'Alice'), ('Bye', None), ('Hello', 'Bob')
+  ]
+
+def test_ingest_places_in_any_order():
+  for attachments in itertools.permutations([
+    _place('https://apparebit.com'), _place('https://example.com'), _place()
+  ]):
+    post = ingest_post(Validator[Any]({
+      'timestamp': 665,
+      'attachments': list(attachments),
+    }, filename='places'))
+    assert sorted(p.url for p in post.places) == [
+      'https://apparebit.com', 'https://example.com'
+    ]
+
+def test_media_type_from_extension():
+  post = ingest_post(Validator[Any]({
+    'timestamp': 665,
+    'attachments': [
+      { 'data': [{ 'media': { 'creation_timestamp': 665, 'uri': uri }}]}
+      for uri in ('clip.mp4', 'mp4', 'photo.jpg')
+    ],
+  }, filename='extensions'))
+  assert [m.media_type for m in post.media] == [
+    MediaType.VIDEO, MediaType.PHOTO, MediaType.PHOTO
+  ]
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
 import pytest
 
 from deface.error import MergeError
@@ -120,3 +121,45 @@ def test_merge_media() -> None:
   with pytest.raises(MergeError) as x:
     media3.merge(media4)
   assert x.value.args[0].startswith('Unable to merge media descriptors')
+
+def test_media_without_description() -> None:
+  media = Media(
+    comments=tuple([Comment(author='Alice', comment='wow', timestamp=1999)]),
+    media_type=MediaType.VIDEO,
+    uri='somewhere.mp4',
+    description='a video',
+    title='Mobile Uploads',
+    upload_timestamp=665,
+  )
+
+  plain = media.without_description()
+  assert plain.description is None
+  assert plain == dataclasses.replace(media, description=None)
+  assert plain.without_description() is plain
+
+def test_merge_posts() -> None:
+  photo = Media(media_type=MediaType.PHOTO, uri='photo.jpg')
+  video = Media(media_type=MediaType.VIDEO, uri='video.mp4', title='')
+
+  post1 = Post(timestamp=665, post='Curiouser and curiouser!')
+  post2 = dataclasses.replace(post1, title='Alice', media=(photo,))
+  post3 = dataclasses.replace(post1, media=(photo, video))
+
+  assert post1.merge(post2) == post2
+  assert post2.merge(post1) == post2
+  assert post2.merge(post3) == dataclasses.replace(post3, title='Alice')
+
+  with pytest.raises(MergeError) as x:
+    post3.merge(dataclasses.replace(post1, media=(
+      dataclasses.replace(video, description='a video'),
+    )))
+  assert x.value.args[0].startswith('Unable to merge posts with different')
+
+  # Duplicate URIs on one side are checked even if the other side has no media.
+  post4 = dataclasses.replace(post1, media=(
+    video, dataclasses.replace(video, description='a video')
+  ))
+  for one, other in ((post1, post4), (post4, post1)):
+    with pytest.raises(MergeError) as x:
+      one.merge(other)
+    assert x.value.args[0].startswith('Unable to merge posts with different')
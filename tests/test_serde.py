@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from deface.serde import dumps, loads, restore_utf8
+import pytest
+
+from deface.serde import dumper, dumps, iter_items, loads, restore_utf8
 
 def test_restore_from_mojibake():
   assert restore_utf8(
@@ -29,6 +31,11 @@ def test_restore_from_mojibake():
     rb"sequences such as '\\u00e2\\u009c\\u0094\\u00ef\\u00b8\\u008f'"
   ).decode('utf8') == r"sequences such as '\\u00e2\\u009c\\u0094\\u00ef\\u00b8\\u008f'"
 
+  # Yet another backslash turns it back into a unicode escape.
+  assert restore_utf8(
+    rb"\\\u00c3\u00a9 but not \\\\u00e9"
+  ).decode('utf8') == r"\\é but not \\\\u00e9"
+
 
 def test_loads_dumps():
   json = loads(b'{"answer": 42}')
@@ -43,3 +50,36 @@ def test_loads_dumps():
   text = dumps(json)
 
   assert text == '{"answer": 42}'
+
+
+def test_iter_items():
+  assert list(iter_items(b' [ ] ')) == []
+  assert list(iter_items(b'[{"answer": 42}, 665 ,"R\\u00c3\\u00b3is"]')) == [
+    {'answer': 42}, 665, 'Róis'
+  ]
+  assert list(iter_items(b'{"items": [1, 2]}', field='items')) == [1, 2]
+  assert list(iter_items(
+    b'{"noise": {"items": [0]}, "items": [1, 2], "more_noise": 3}', field='items'
+  )) == [1, 2]
+
+  with pytest.raises(ValueError):
+    iter_items(b'{"items": [1, 2]}')
+  with pytest.raises(ValueError):
+    list(iter_items(b'[1 2]'))
+  with pytest.raises(ValueError):
+    list(iter_items(b'[1, 2] 3'))
+  with pytest.raises(ValueError):
+    list(iter_items(b'{"items": 42}', field='items'))
+
+  # Items are parsed as they are consumed, so those before an error arrive.
+  items = iter_items(b'[1, 2, oops]')
+  assert next(items) == 1
+  assert next(items) == 2
+  with pytest.raises(ValueError):
+    next(items)
+
+
+def test_dumper():
+  data = { 'answer': 42, 'noise': None, 'list': [1, 2] }
+  assert dumper()(data) == dumps(data)
+  assert dumper(indent=2)(data) == dumps(data, indent=2)